@@ -632,6 +632,11 @@ function setupIpcHandlers() {
         return captureService.getActiveApplication();
     });
 
+    // Clipboard writes by the app itself - the Python monitor skips them instead of logging a copy
+    ipcMain.handle('clipboard:self-write', async (event, text) => {
+        return pythonBridge ? pythonBridge.sendToPython({ type: 'clipboard_self_write', content: text }) : false;
+    });
+
     // Get system info
     ipcMain.handle('system:get-info', async () => {
         return {
@@ -73,6 +73,9 @@ contextBridge.exposeInMainWorld('electronAPI', {
         ipcRenderer.on('mark:capture-resumed', (event) => callback());
     },
     
+    // Tell the Python clipboard monitor that the app itself is about to write text
+    markClipboardWrite: (text) => ipcRenderer.invoke('clipboard:self-write', text),
+    
     // Generic invoke for new handlers
     invoke: (channel, data) => ipcRenderer.invoke(channel, data),
     
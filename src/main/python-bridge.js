@@ -28,18 +28,30 @@ class PythonBridge extends EventEmitter {
         this.captureService = captureService;
 
         try {
-            this.wss = new WebSocket.Server({ port: this.port });
+            this.wss = new WebSocket.Server({ port: this.port, perMessageDeflate: false });
             
             this.wss.on('connection', (ws) => {
                 console.log('🐍 Python service connected');
                 this.pythonClient = ws;
                 
                 ws.on('message', (data) => {
+                    let events;
                     try {
-                        const event = JSON.parse(data);
-                        this.handlePythonEvent(event);
+                        // Python sends UTF-8 JSON as binary frames
+                        const message = JSON.parse(data.toString('utf8'));
+                        // Python coalesces bursts into a single batch frame
+                        events = message.type === 'batch' ? message.events : [message];
                     } catch (error) {
                         console.error('Error parsing Python event:', error);
+                        return;
+                    }
+                    // Each event fails on its own, so one bad handler doesn't drop the rest of the batch
+                    for (const event of events) {
+                        try {
+                            this.handlePythonEvent(event);
+                        } catch (error) {
+                            console.error('Error handling Python event:', error);
+                        }
                     }
                 });
                 
@@ -168,6 +180,15 @@ class PythonBridge extends EventEmitter {
                     description: 'Python capture service connected'
                 };
             
+            case 'capture_overflow':
+                return {
+                    ...baseEvent,
+                    type: 'system',
+                    action: 'capture-overflow',
+                    dropped: pythonEvent.dropped,
+                    description: `⚠️ Python capture dropped ${pythonEvent.dropped} events (queue full)`
+                };
+            
             case 'clipboard_copy':
                 return {
                     ...baseEvent,
@@ -5,20 +5,25 @@ Captures file system operations, desktop interactions, and bridges with Electron
 """
 
 import os
+import re
 import sys
 import json
 import time
 import platform
+import signal
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 import threading
 import queue
+import functools
+import logging
+import logging.handlers
 
 # File system monitoring
 from watchdog import observers
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import RegexMatchingEventHandler
 
 # IPC with Electron
 import socket
@@ -26,130 +31,419 @@ import asyncio
 import websockets
 
 # Clipboard monitoring
-from clipboard_monitor import ClipboardMonitor
+from clipboard_monitor import ClipboardMonitor, NUMBER_TEXT_RE
+from clipboard_monitor import run_applescript as _run_applescript  # one compiled-script cache for both
+
+# Resolved once - platform.system() is consulted on every capture path
+SYSTEM = platform.system()
 
 # Platform-specific imports
-if platform.system() == "Windows":
+if SYSTEM == "Windows":
+    import pythoncom
     import win32com.client
+    import win32event
     import win32gui
     import win32process
-elif platform.system() == "Darwin":  # macOS
+elif SYSTEM == "Darwin":  # macOS
     import applescript
     import Quartz
 
-class FileSystemCapture(FileSystemEventHandler):
+# Event loop backend for the WebSocket bridge (optional) - Windows keeps its default Proactor loop
+try:
+    # libuv-based loop - less per-message overhead for small JSON events
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Fast JSON encoding for the WebSocket bridge (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Multi-pattern matching for web app detection (optional, regex fallback)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _json_default(obj):
+    """Serialize types stdlib json doesn't handle natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode a message for Electron as UTF-8 JSON bytes (sent as a binary frame)"""
+    if orjson:
+        return orjson.dumps(obj, default=_json_default)
+    return json.dumps(obj, default=_json_default).encode('utf-8')
+
+
+def _json_loads(message):
+    """Decode a message from Electron"""
+    if orjson:
+        return orjson.loads(message)
+    return json.loads(message)
+
+
+# Per-event logging - records are formatted and written on a listener thread
+logger = logging.getLogger('capture')
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread"""
+    
+    def prepare(self, record):
+        return record
+
+
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """Route capture logs to stdout through a background listener"""
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(_DeferredQueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    return listener
+
+
+class CaptureEventQueue(queue.Queue):
+    """Bounded event queue - drops the oldest event instead of blocking producers"""
+    
+    def __init__(self, maxsize: int = 10_000):
+        super().__init__(maxsize)
+        self.dropped = 0
+        # asyncio consumer, woken once per burst rather than once per event
+        self._loop = None
+        self._wakeup = None
+        self._wakeup_pending = False
+    
+    def put(self, item, block=True, timeout=None):
+        """Add item, evicting the oldest event when full (never blocks)"""
+        with self.not_full:
+            if 0 < self.maxsize <= self._qsize():
+                self._get()
+                self.dropped += 1
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+            if self._loop and not self._wakeup_pending:
+                self._wakeup_pending = True
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+    
+    def attach_loop(self, loop: asyncio.AbstractEventLoop) -> asyncio.Event:
+        """Return an event set on loop whenever items arrive (call from the loop)"""
+        with self.mutex:
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._wakeup_pending = False
+            if self._qsize():
+                self._wakeup.set()
+        return self._wakeup
+    
+    def detach_loop(self):
+        """Stop waking the asyncio consumer"""
+        with self.mutex:
+            self._loop = None
+            self._wakeup = None
+    
+    def take_all(self) -> List[Any]:
+        """Remove and return everything queued, re-arming the consumer wakeup"""
+        with self.not_full:
+            self._wakeup_pending = False
+            items = [self._get() for _ in range(self._qsize())]
+            self.not_full.notify_all()
+        return items
+    
+    def record_dropped(self, count: int):
+        """Count events dropped further downstream so they are reported together"""
+        with self.mutex:
+            self.dropped += count
+    
+    def take_dropped(self) -> int:
+        """Return and reset the number of events dropped since the last call"""
+        with self.mutex:
+            dropped, self.dropped = self.dropped, 0
+        return dropped
+
+
+class FileSystemCapture(RegexMatchingEventHandler):
     """Captures file system operations - moves, copies, deletes, renames"""
     
+    # Folder kinds recognised anywhere in a path - one scan finds all of them
+    CONTEXT_FOLDERS = re.compile(
+        r'(?P<is_download>Downloads)|(?P<is_desktop>Desktop)|(?P<is_documents>Documents)'
+        r'|(?P<is_cloud>Dropbox|OneDrive|Google Drive|iCloud)'
+    )
+    # Debounce - the first event on a quiet path is reported at once, the rest of a
+    # burst once the path has been quiet this long (or has been held for MAX_HOLD)
+    COALESCE_INTERVAL = 0.1  # seconds
+    MAX_HOLD = 0.5  # seconds
+    
+    # Only capture modifications to office docs, PDFs and data files
+    RELEVANT_EXTENSIONS = frozenset({'.xlsx', '.docx', '.pdf', '.csv', '.txt', '.json', '.xml'})
+    
     def __init__(self, event_queue: queue.Queue):
         self.event_queue = event_queue
+        self.monitoring = False
+        self.drain_thread = None
+        
+        # Events waiting to be flushed, keyed by (type, path)
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._last_emit = {}  # path -> time.monotonic() it was last reported
+        self._wakeup = threading.Event()  # wakes the drain thread early
         self.ignored_paths = [
             '.git', '__pycache__', 'node_modules', '.DS_Store',
             'Thumbs.db', '.pytest_cache', '.vscode', '.idea'
         ]
+        # One compiled scan instead of a substring test per ignored name
+        ignore_pattern = '|'.join(map(re.escape, self.ignored_paths))
+        self._ignore_re = re.compile(ignore_pattern)
+        
+        # Let watchdog drop directories and ignored paths before on_* dispatch
+        super().__init__(
+            ignore_regexes=[f'.*(?:{ignore_pattern})'],
+            ignore_directories=True,
+            case_sensitive=True
+        )
     
     def should_ignore(self, path: str) -> bool:
         """Check if path should be ignored"""
-        path_str = str(path)
-        return any(ignored in path_str for ignored in self.ignored_paths)
+        return self._ignore_re.search(path) is not None
+    
+    def start(self):
+        """Start flushing coalesced events to the event queue"""
+        if self.monitoring:
+            return
+        self.monitoring = True
+        self.drain_thread = threading.Thread(target=self._drain_loop)
+        self.drain_thread.daemon = True
+        self.drain_thread.start()
+    
+    def stop(self):
+        """Stop flushing and send whatever is still pending"""
+        self.monitoring = False
+        self._wakeup.set()
+        if self.drain_thread:
+            self.drain_thread.join(timeout=1)
+            self.drain_thread = None
+        self._flush(force=True)
+    
+    def _queue_event(self, event_type: str, src_path: str, dest_path: Optional[str] = None):
+        """Record a raw event for the drain thread - the observer thread does nothing else"""
+        path = dest_path or src_path
+        key = (event_type, path)
+        now = time.monotonic()
+        with self._pending_lock:
+            if event_type == 'file_modified' and ('file_created', path) in self._pending:
+                # Still being written - fold into the pending created event
+                key = ('file_created', path)
+                event_type = 'file_created'
+            
+            was_idle = not self._pending
+            entry = self._pending.pop(key, None)
+            if entry:
+                first, immediate = entry[3], entry[5]
+            else:
+                first = now
+                immediate = now - self._last_emit.get(path, float('-inf')) >= self.COALESCE_INTERVAL
+            
+            # Re-insert so flush order follows the latest occurrence
+            self._pending[key] = (event_type, src_path, dest_path, first, now, immediate)
+        
+        if immediate or was_idle:
+            self._wakeup.set()
+    
+    def _drain_loop(self):
+        """Move debounced events to the event queue as they become due"""
+        while self.monitoring:
+            with self._pending_lock:
+                idle = not self._pending
+            # Nothing waiting - sleep until the next event arrives
+            self._wakeup.wait(None if idle else self.COALESCE_INTERVAL / 2)
+            self._wakeup.clear()
+            self._flush()
+    
+    def _flush(self, force: bool = False):
+        """Build capture events for every due pending event and queue them in one pass"""
+        now = time.monotonic()
+        due = []
+        with self._pending_lock:
+            for key, entry in list(self._pending.items()):
+                first, last, immediate = entry[3:]
+                if (force or immediate or now - last >= self.COALESCE_INTERVAL
+                        or now - first >= self.MAX_HOLD):
+                    del self._pending[key]
+                    due.append(entry)
+            if not due:
+                return
+            
+            # Paths quiet for a full interval count as quiet again
+            self._last_emit = {
+                path: emitted for path, emitted in self._last_emit.items()
+                if now - emitted < self.COALESCE_INTERVAL
+            }
+            for entry in due:
+                self._last_emit[entry[2] or entry[1]] = now
+        
+        # One clock read per flush - events in a pass are within COALESCE_INTERVAL
+        stamp = datetime.now()
+        for event_type, src_path, dest_path, *_ in due:
+            event = self._build_event(event_type, src_path, dest_path)
+            if event:
+                event['timestamp'] = stamp
+                self.event_queue.put(event)
+    
+    def _build_event(self, event_type: str, src_path: str, dest_path: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Enrich a raw watchdog event - None if it isn't worth reporting"""
+        path = dest_path or src_path
+        filename = os.path.basename(path)
+        extension = os.path.splitext(filename)[1]
+        
+        if event_type == 'file_moved':
+            return {
+                'type': event_type,
+                'source_path': src_path,
+                'dest_path': dest_path,
+                'filename': filename,
+                'extension': extension,
+                'context': self._get_context(dest_path)
+            }
+        
+        if event_type == 'file_modified':
+            if extension.lower() not in self.RELEVANT_EXTENSIONS:
+                return None
+            return {
+                'type': event_type,
+                'path': path,
+                'filename': filename,
+                'extension': extension,
+                # Stat once per coalesced event rather than per raw modification
+                'size': self._get_file_size(path)
+            }
+        
+        event = {
+            'type': event_type,
+            'path': path,
+            'filename': filename,
+            'extension': extension
+        }
+        if event_type == 'file_created':
+            event['context'] = self._get_context(path)
+        return event
     
     def on_moved(self, event):
-        """File or directory moved/renamed"""
-        if not event.is_directory and not self.should_ignore(event.src_path):
-            self.event_queue.put({
-                'type': 'file_moved',
-                'timestamp': datetime.now().isoformat(),
-                'source_path': event.src_path,
-                'dest_path': event.dest_path,
-                'filename': Path(event.dest_path).name,
-                'extension': Path(event.dest_path).suffix,
-                'context': self._get_context(event.dest_path)
-            })
+        """File moved/renamed"""
+        self._queue_event('file_moved', event.src_path, event.dest_path)
     
     def on_created(self, event):
-        """File or directory created"""
-        if not event.is_directory and not self.should_ignore(event.src_path):
-            self.event_queue.put({
-                'type': 'file_created',
-                'timestamp': datetime.now().isoformat(),
-                'path': event.src_path,
-                'filename': Path(event.src_path).name,
-                'extension': Path(event.src_path).suffix,
-                'context': self._get_context(event.src_path)
-            })
+        """File created"""
+        self._queue_event('file_created', event.src_path)
     
     def on_deleted(self, event):
-        """File or directory deleted"""
-        if not event.is_directory and not self.should_ignore(event.src_path):
-            self.event_queue.put({
-                'type': 'file_deleted',
-                'timestamp': datetime.now().isoformat(),
-                'path': event.src_path,
-                'filename': Path(event.src_path).name,
-                'extension': Path(event.src_path).suffix
-            })
+        """File deleted"""
+        self._queue_event('file_deleted', event.src_path)
     
     def on_modified(self, event):
-        """File modified - filter for relevant changes"""
-        if not event.is_directory and not self.should_ignore(event.src_path):
-            # Only capture modifications to office docs, PDFs, images
-            relevant_extensions = ['.xlsx', '.docx', '.pdf', '.csv', '.txt', '.json', '.xml']
-            if Path(event.src_path).suffix.lower() in relevant_extensions:
-                self.event_queue.put({
-                    'type': 'file_modified',
-                    'timestamp': datetime.now().isoformat(),
-                    'path': event.src_path,
-                    'filename': Path(event.src_path).name,
-                    'extension': Path(event.src_path).suffix,
-                    'size': self._get_file_size(event.src_path)
-                })
+        """File modified - relevance is decided at flush time"""
+        self._queue_event('file_modified', event.src_path)
     
     def _get_context(self, path: str) -> Dict[str, Any]:
         """Get context about where the file came from/is going"""
-        path_obj = Path(path)
-        context = {
-            'is_download': 'Downloads' in str(path),
-            'is_desktop': 'Desktop' in str(path),
-            'is_documents': 'Documents' in str(path),
-            'is_cloud': any(cloud in str(path) for cloud in ['Dropbox', 'OneDrive', 'Google Drive', 'iCloud']),
-            'parent_folder': path_obj.parent.name
+        return self._folder_context(os.path.dirname(str(path)))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _folder_context(folder: str) -> Dict[str, Any]:
+        """Context for a folder - cached, so the returned dict must not be modified"""
+        found = {match.lastgroup for match in FileSystemCapture.CONTEXT_FOLDERS.finditer(folder)}
+        return {
+            'is_download': 'is_download' in found,
+            'is_desktop': 'is_desktop' in found,
+            'is_documents': 'is_documents' in found,
+            'is_cloud': 'is_cloud' in found,
+            'parent_folder': os.path.basename(folder)
         }
-        return context
     
     def _get_file_size(self, path: str) -> Optional[int]:
         """Get file size in bytes"""
         try:
-            return os.path.getsize(path)
+            return os.stat(path).st_size
         except:
             return None
 
 
+def _excel_column_name(index: int) -> str:
+    """Convert a 1-based column index to Excel letters (1 -> A, 28 -> AB)"""
+    name = ''
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        name = chr(65 + remainder) + name
+    return name
+
+
+class ExcelAppEvents:
+    """COM event sink for Excel.Application (Windows) - pushes selection changes"""
+    
+    capture = None  # Owning ExcelCapture, set once WithEvents has bound the sink
+    excel = None  # Excel.Application proxy of the event thread - COM objects stay on their thread
+    
+    def OnSheetSelectionChange(self, Sh, Target):
+        """Excel changed selection - capture the new range without polling"""
+        if self.capture:
+            self.capture.capture_selection(win32com.client.Dispatch(Target), self.excel)
+
+
 class ExcelCapture:
     """Captures Excel operations - cell edits, formula changes, sheet navigation"""
     
+    MAX_CELLS = 10  # cells included in each selection event
+    
+    # Text shapes recognised in cell values - matched instead of parsing with float()
+    NUMBER_TEXT = NUMBER_TEXT_RE  # same semantics as clipboard values
+    DATE_TEXT = re.compile(r'\s*\d+\s*[-/]\s*\d+\s*[-/]\s*\d+\s*')
+    
     def __init__(self, event_queue: queue.Queue):
         self.event_queue = event_queue
         self.excel = None
         self.active_workbook = None
         self.last_selection = None
         self.monitoring = False
+        self.events = None  # COM event sink when selection changes are pushed
+        self._events_thread = None  # STA thread that owns the sink and pumps its messages
+        self._events_stop = None  # win32 event handle that ends the pump
+        self._selection_lock = threading.Lock()  # the event thread and paste lookups share last_selection
+        # Selection reader for this platform, picked once
+        if SYSTEM == "Windows":
+            self._capture_platform = self._capture_windows_excel
+        elif SYSTEM == "Darwin":
+            self._capture_platform = self._capture_macos_excel
+        else:
+            self._capture_platform = None
     
     def connect(self) -> bool:
         """Connect to Excel instance"""
         try:
-            if platform.system() == "Windows":
+            if SYSTEM == "Windows":
                 import win32com.client
                 try:
                     # Try to get existing Excel instance
                     self.excel = win32com.client.GetObject(Class="Excel.Application")
-                    return True
                 except:
                     # No Excel running
                     return False
-            elif platform.system() == "Darwin":
+                # Subscribe to selection changes so poll() has nothing to do
+                self._start_events_thread()
+                return True
+            elif SYSTEM == "Darwin":
                 # macOS - use AppleScript
                 try:
-                    script = applescript.AppleScript('tell application "Microsoft Excel" to get name')
-                    result = script.run()
+                    result = _run_applescript('tell application "Microsoft Excel" to get name')
                     if result:
                         self.excel = True  # Flag for macOS
                         return True
@@ -159,31 +453,80 @@ class ExcelCapture:
         except:
             return False
     
-    def capture_selection(self):
-        """Capture current Excel selection with values"""
+    def _start_events_thread(self):
+        """Start the selection-change sink on its own STA thread, waiting until it is bound"""
+        ready = threading.Event()
+        self._events_stop = win32event.CreateEvent(None, True, False, None)
+        self._events_thread = threading.Thread(target=self._pump_events, args=(ready,), daemon=True)
+        self._events_thread.start()
+        ready.wait(5)
+    
+    def _pump_events(self, ready: threading.Event):
+        """Own the COM event sink and pump its messages as they arrive"""
+        # Excel calls OnSheetSelectionChange synchronously across processes and its UI waits
+        # until the call is pumped - so wake on every message instead of on a timer
+        pythoncom.CoInitialize()
         try:
-            if platform.system() == "Windows" and self.excel:
-                self._capture_windows_excel()
-            elif platform.system() == "Darwin" and self.excel:
-                self._capture_macos_excel()
+            try:
+                excel = win32com.client.GetObject(Class="Excel.Application")
+                events = win32com.client.WithEvents(excel, ExcelAppEvents)
+                events.capture = self
+                events.excel = excel
+            except Exception as e:
+                print(f"Excel events unavailable, polling selection instead: {e}")
+                return
+            finally:
+                ready.set()
+            
+            self.events = events
+            while win32event.MsgWaitForMultipleObjects(
+                    [self._events_stop], False, win32event.INFINITE, win32event.QS_ALLINPUT
+            ) != win32event.WAIT_OBJECT_0:
+                pythoncom.PumpWaitingMessages()
+            self.events = None
+            events.excel = None
+            del events, excel
+        finally:
+            pythoncom.CoUninitialize()
+    
+    def stop(self):
+        """Stop the selection-change event thread, if running"""
+        if self._events_thread:
+            win32event.SetEvent(self._events_stop)
+            self._events_thread.join(timeout=2)
+            self._events_thread = None
+    
+    def poll(self):
+        """Check for selection changes - nothing to do while the event thread pushes them"""
+        if not self.events:
+            self.capture_selection()
+    
+    def capture_selection(self, selection=None, excel=None):
+        """Capture current (or given) Excel selection with values - excel is the calling thread's proxy"""
+        if not (self.excel and self._capture_platform):
+            return
+        try:
+            with self._selection_lock:
+                self._capture_platform(selection, excel)
         except Exception as e:
-            print(f"Excel capture error: {e}")
+            logger.error("Excel capture error: %s", e)
     
-    def _capture_windows_excel(self):
+    def _capture_windows_excel(self, selection=None, excel=None):
         """Capture Excel data on Windows"""
         try:
-            selection = self.excel.Selection
-            sheet = self.excel.ActiveSheet
-            workbook = self.excel.ActiveWorkbook
+            excel = excel or self.excel
+            if selection is None:
+                selection = excel.Selection
             
-            # Get selection details
+            # Skip if same selection - before any other COM round trips
             address = selection.Address
-            
-            # Skip if same selection
             if address == self.last_selection:
                 return
             self.last_selection = address
             
+            sheet = excel.ActiveSheet
+            workbook = excel.ActiveWorkbook
+            
             # Get values (handle single cell vs range)
             value = None
             formula = None
@@ -200,41 +543,42 @@ class ExcelCapture:
                         'formula': formula
                     }]
                 else:
-                    # Multiple cells
-                    values = selection.Value
-                    if values:
-                        # Convert to list of cell data
-                        for i, row in enumerate(values):
-                            if isinstance(row, (list, tuple)):
-                                for j, val in enumerate(row):
-                                    cell = selection.Cells(i+1, j+1)
-                                    cell_data.append({
-                                        'address': cell.Address,
-                                        'value': val,
-                                        'formula': cell.Formula if cell.HasFormula else None
-                                    })
-                            else:
-                                # Single column/row
-                                cell = selection.Cells(i+1, 1)
-                                cell_data.append({
-                                    'address': cell.Address,
-                                    'value': row,
-                                    'formula': cell.Formula if cell.HasFormula else None
-                                })
+                    # Multiple cells - read only the cells we report, as two
+                    # bulk array fetches instead of per-cell COM calls
+                    take_cols = min(selection.Columns.Count, self.MAX_CELLS)
+                    take_rows = min(selection.Rows.Count, -(-self.MAX_CELLS // take_cols))
+                    head = selection.Resize(take_rows, take_cols)
+                    values = head.Value
+                    formulas = head.Formula
+                    if not isinstance(values, tuple):
+                        # A 1x1 range comes back as a scalar
+                        values, formulas = ((values,),), ((formulas,),)
+                    
+                    # Addresses are computed locally from the top-left corner
+                    first_row, first_col = selection.Row, selection.Column
+                    for i, row in enumerate(values):
+                        for j, val in enumerate(row):
+                            cell_formula = formulas[i][j]
+                            cell_data.append({
+                                'address': f"${_excel_column_name(first_col + j)}${first_row + i}",
+                                'value': val,
+                                'formula': cell_formula if isinstance(cell_formula, str) and cell_formula.startswith('=') else None
+                            })
+                    cell_data = cell_data[:self.MAX_CELLS]
             except:
                 pass
             
             # Create event
             event = {
                 'type': 'excel_selection',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': datetime.now(),
                 'address': address,
                 'sheet': sheet.Name,
                 'workbook': workbook.Name,
                 'workbook_path': workbook.FullName,
                 'value': value,  # Primary value for single cells
                 'formula': formula,
-                'cells': cell_data[:10],  # Limit to first 10 cells
+                'cells': cell_data,  # At most MAX_CELLS cells
                 'cell_count': selection.Count,
                 'context': {
                     'has_formula': any(c.get('formula') for c in cell_data),
@@ -243,13 +587,14 @@ class ExcelCapture:
             }
             
             self.event_queue.put(event)
-            print(f"📊 Excel: Selected {address} in {sheet.Name} - {self._preview_value(value)}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📊 Excel: Selected %s in %s - %s", address, event['sheet'], self._preview_value(value))
             
         except Exception as e:
-            print(f"Windows Excel capture error: {e}")
+            logger.error("Windows Excel capture error: %s", e)
     
-    def _capture_macos_excel(self):
-        """Capture Excel data on macOS using AppleScript"""
+    def _capture_macos_excel(self, selection=None, excel=None):
+        """Capture Excel data on macOS using AppleScript (always reads the current selection)"""
         try:
             # Get current selection info
             script = '''
@@ -262,8 +607,7 @@ class ExcelCapture:
                 return {addr, sheetName, wbName, val}
             end tell
             '''
-            as_script = applescript.AppleScript(script)
-            result = as_script.run()
+            result = _run_applescript(script)
             
             if result:
                 # Parse result - it could be a list or string
@@ -284,7 +628,7 @@ class ExcelCapture:
                     
                     event = {
                         'type': 'excel_selection',
-                        'timestamp': datetime.now().isoformat(),
+                        'timestamp': datetime.now(),
                         'address': address,
                         'sheet': parts[1],
                         'workbook': parts[2],
@@ -295,10 +639,10 @@ class ExcelCapture:
                     }
                     
                     self.event_queue.put(event)
-                    print(f"📊 Excel: Selected {address} in {parts[1]}")
+                    logger.info("📊 Excel: Selected %s in %s", address, parts[1])
                     
         except Exception as e:
-            print(f"macOS Excel capture error: {e}")
+            logger.error("macOS Excel capture error: %s", e)
     
     def _detect_excel_data_type(self, value):
         """Detect the type of data in Excel cell"""
@@ -309,20 +653,21 @@ class ExcelCapture:
             # Range of cells
             return 'range'
         
+        # COM hands back native numbers and dates - no need to parse a string
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return 'number'
+        if isinstance(value, datetime):
+            return 'date'
+        
         value_str = str(value)
         
         # Check for number
-        try:
-            float(value_str)
+        if self.NUMBER_TEXT.fullmatch(value_str):
             return 'number'
-        except:
-            pass
         
         # Check for date (basic)
-        if '/' in value_str or '-' in value_str:
-            parts = value_str.replace('/', '-').split('-')
-            if len(parts) == 3 and all(p.strip().isdigit() for p in parts):
-                return 'date'
+        if self.DATE_TEXT.fullmatch(value_str):
+            return 'date'
         
         # Check for formula
         if value_str.startswith('='):
@@ -349,17 +694,23 @@ class ExcelCapture:
 class DesktopCapture:
     """Captures desktop application interactions"""
     
+    CACHE_TTL = 0.2  # seconds the active window lookup is reused for
+    
     def __init__(self, event_queue: queue.Queue):
         self.event_queue = event_queue
         self.active_window = None
+        self._active_window_time = 0.0
     
     def get_active_window(self) -> Dict[str, Any]:
-        """Get information about the active window"""
+        """Get information about the active window - cached briefly, so don't modify it"""
+        now = time.monotonic()
+        if self.active_window is not None and now - self._active_window_time < self.CACHE_TTL:
+            return self.active_window
+        
         window_info = {}
         
-        if platform.system() == "Windows":
+        if SYSTEM == "Windows":
             try:
-                import win32gui
                 hwnd = win32gui.GetForegroundWindow()
                 window_info = {
                     'title': win32gui.GetWindowText(hwnd),
@@ -368,11 +719,13 @@ class DesktopCapture:
                 }
             except:
                 pass
-        elif platform.system() == "Darwin":
+        elif SYSTEM == "Darwin":
             try:
-                # Use Quartz for macOS
-                from Quartz import CGWindowListCopyWindowInfo, kCGWindowListOptionOnScreenOnly, kCGNullWindowID
-                window_list = CGWindowListCopyWindowInfo(kCGWindowListOptionOnScreenOnly, kCGNullWindowID)
+                # Use Quartz for macOS - front-to-back, so the first normal window is active
+                window_list = Quartz.CGWindowListCopyWindowInfo(
+                    Quartz.kCGWindowListOptionOnScreenOnly | Quartz.kCGWindowListExcludeDesktopElements,
+                    Quartz.kCGNullWindowID
+                )
                 for window in window_list:
                     if window.get('kCGWindowLayer', 0) == 0:
                         window_info = {
@@ -384,14 +737,116 @@ class DesktopCapture:
             except:
                 pass
         
+        self.active_window = window_info
+        self._active_window_time = now
         return window_info
 
 
+@functools.lru_cache(maxsize=64)
+def _title_suffixes(app_name: str) -> Tuple[str, ...]:
+    """Window title suffixes for an app, in priority order - app name first, then vendors"""
+    return (f' - {app_name}', f' — {app_name}', f' – {app_name}',
+            ' - Microsoft', ' - Google', ' - Adobe')
+
+
+# Default paths to monitor
+_DEFAULT_WATCH = tuple(str(Path.home() / folder) for folder in ('Downloads', 'Desktop', 'Documents'))
+
+
+# Application type keywords, in priority order - each branch is tried over the
+# whole name before the next, so "Code - Sheets" is still a spreadsheet
+_APP_TYPE_RE = re.compile(
+    r'.*?(?P<spreadsheet>excel|sheets)'
+    r'|.*?(?P<document>word|docs)'
+    r'|.*?(?P<presentation>powerpoint|slides)'
+    r'|.*?(?P<web_application>chrome|safari|firefox|edge)'
+    r'|.*?(?P<code_editor>code|sublime|atom)',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Display format for a paste location, by context type - name is document or app
+def _format_spreadsheet_location(context, name):
+    """Workbook!Sheet!Address"""
+    loc = context.get('location')
+    if not loc:
+        return name
+    return f"{name}!{loc.get('sheet') or ''}!{loc.get('address') or ''}"
+
+
+def _format_document_location(context, name):
+    """Document (Page n, Para n)"""
+    loc = context.get('location')
+    if not loc:
+        return name
+    return f"{name} (Page {loc.get('page', '?')}, Para {loc.get('paragraph', '?')})"
+
+
+def _format_presentation_location(context, name):
+    """Presentation (Slide n)"""
+    loc = context.get('location')
+    if not loc:
+        return name
+    return f"{name} (Slide {loc.get('slide', '?')})"
+
+
+def _format_web_location(context, name):
+    """Web app: page title"""
+    web_app = context.get('web_app', context.get('domain', context.get('application', 'Unknown')))
+    return f"{web_app}: {context.get('page_title', 'Unknown page')}"
+
+
+_LOCATION_FORMATTERS = {
+    'spreadsheet': _format_spreadsheet_location,
+    'document': _format_document_location,
+    'presentation': _format_presentation_location,
+    'web_application': _format_web_location,
+}
+
+# Data transformation implied by pasting between (source, destination) app types
+_TRANSFORMATIONS = {
+    ('spreadsheet', 'document'): 'table_to_text',
+    ('spreadsheet', 'presentation'): 'data_to_slide',
+    ('spreadsheet', 'web_application'): 'data_to_form',
+    ('document', 'spreadsheet'): 'text_to_cells',
+    ('document', 'presentation'): 'text_to_slide',
+    ('document', 'web_application'): 'text_to_form',
+    ('web_application', 'spreadsheet'): 'web_to_data',
+    ('web_application', 'document'): 'web_to_text'
+}
+
+
 class ProcessCaptureService:
     """Main service coordinating all capture types"""
     
+    # Outbound batching - coalesce bursts into a single WebSocket frame
+    BATCH_MAX_EVENTS = 16
+    BATCH_MAX_DELAY = 0.005  # seconds to wait for more events before sending
+    OUTBOX_MAX_BATCHES = 1000  # unsent batches held while Electron catches up
+    # Excel checks on the event loop - frequent while the user is copying and pasting
+    EXCEL_POLL_ACTIVE = 0.25  # seconds
+    EXCEL_POLL_IDLE = 2.0  # seconds
+    ACTIVITY_WINDOW = 5.0  # seconds an activity event keeps polling frequent
+    ACTIVITY_EVENTS = frozenset({'clipboard_copy', 'excel_selection'})
+    
+    # Web applications recognised from browser window titles
+    WEB_APPS = {
+        'salesforce': 'Salesforce',
+        'activecampaign': 'ActiveCampaign',
+        'wordpress': 'WordPress',
+        'gmail': 'Gmail',
+        'docs.google': 'Google Docs',
+        'sheets.google': 'Google Sheets',
+        'notion': 'Notion',
+        'airtable': 'Airtable',
+        'hubspot': 'HubSpot',
+        'slack': 'Slack',
+        'trello': 'Trello',
+        'jira': 'Jira'
+    }
+    WEB_APP_PATTERN = re.compile('|'.join(map(re.escape, WEB_APPS)), re.IGNORECASE)
+    
     def __init__(self):
-        self.event_queue = queue.Queue()
+        self.event_queue = CaptureEventQueue()
         self.observers = []
         self.running = False
         
@@ -401,19 +856,69 @@ class ProcessCaptureService:
         self.desktop_capture = DesktopCapture(self.event_queue)
         self.clipboard_monitor = ClipboardMonitor(self.event_queue)
         
+        # Paste destination handlers, matched against the lowercased app name
+        browser = self._capture_browser_destination
+        self.paste_handlers = (
+            ('excel', self._capture_excel_destination),
+            ('word', self._capture_word_destination),
+            ('powerpoint', self._capture_powerpoint_destination),
+            # All browsers use the same handler
+            ('chrome', browser),
+            ('safari', browser),
+            ('firefox', browser),
+            ('edge', browser),
+            ('opera', browser),
+            ('brave', browser),
+            ('arc', browser),
+            ('vivaldi', browser),
+            ('tor browser', browser),
+            ('duckduckgo', browser),
+        )
+        
+        # Web app detection - one automaton pass over the title when available
+        self.web_app_automaton = None
+        if ahocorasick:
+            self.web_app_automaton = ahocorasick.Automaton()
+            for key, app in self.WEB_APPS.items():
+                self.web_app_automaton.add_word(key, app)
+            self.web_app_automaton.make_automaton()
+        
+        # Running Office applications over COM (Windows), reused across pastes
+        self.com_apps = {}
+        
+        # Paste source built from the last clipboard entry, keyed by its sequence number
+        self._clipboard_seq = -1
+        self._clipboard_source_cache = None
+        
         # WebSocket connection to Electron
         self.websocket = None
         self.electron_connected = False
+        
+        # Persistent event loop for all WebSocket I/O (runs in its own thread)
+        self.loop = None
+        self.loop_thread = None
+        self.outbox = None  # asyncio.Queue of event batches waiting to be sent
+        self.tasks = []
+        self.last_activity = 0.0  # time.monotonic() of the last clipboard, paste or selection
+        self._stop = threading.Event()  # set to shut run() down
     
-    def start_file_monitoring(self, paths: List[str]):
-        """Start monitoring specified paths"""
-        for path in paths:
-            if os.path.exists(path):
-                observer = observers.Observer()
-                observer.schedule(self.file_capture, path, recursive=True)
-                observer.start()
-                self.observers.append(observer)
-                print(f"📁 Monitoring: {path}")
+    def start_file_monitoring(self, paths: Sequence[str]):
+        """Start monitoring specified paths - one observer per root"""
+        self.file_capture.start()
+        roots = []
+        # Shortest first so nested paths are skipped - their parent already covers them
+        for path in sorted({os.path.abspath(p) for p in paths}, key=len):
+            if not os.path.exists(path):
+                continue
+            if any(path.startswith(root + os.sep) for root in roots):
+                continue
+            roots.append(path)
+            
+            observer = observers.Observer()
+            observer.schedule(self.file_capture, path, recursive=True)
+            observer.start()
+            self.observers.append(observer)
+            print(f"📁 Monitoring: {path}")
     
     def stop_file_monitoring(self):
         """Stop all file system observers"""
@@ -421,36 +926,122 @@ class ProcessCaptureService:
             observer.stop()
             observer.join()
         self.observers.clear()
+        self.file_capture.stop()
+    
+    def start_event_loop(self):
+        """Start the persistent asyncio loop used for WebSocket I/O and Excel polling"""
+        self.loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        if SYSTEM == "Windows":
+            # COM objects are bound to the thread that created them - all of ours live here
+            self.loop.call_soon(pythoncom.CoInitialize)
+        self.loop_thread = threading.Thread(target=self.loop.run_forever)
+        self.loop_thread.daemon = True
+        self.loop_thread.start()
+    
+    def call_in_loop(self, func, *args):
+        """Run a blocking call on the event loop thread and wait for its result"""
+        async def call():
+            return func(*args)
+        return asyncio.run_coroutine_threadsafe(call(), self.loop).result()
+    
+    async def _in_executor(self, func, *args):
+        """Run a blocking call off the loop - AppleScript can wait out a 120 s Apple-event timeout"""
+        return await self.loop.run_in_executor(None, func, *args)
+    
+    def _excel_tick(self):
+        """Poll Excel, then schedule the next check on the loop"""
+        if not self.running:
+            return
+        if self.excel_capture.excel:
+            if SYSTEM == "Darwin":
+                # AppleScript polls run in the executor - the next tick is scheduled once this one is done
+                polled = self.loop.run_in_executor(None, self.excel_capture.poll)
+                polled.add_done_callback(lambda _: self._schedule_excel_tick())
+                return
+            # COM objects live on the loop thread
+            self.excel_capture.poll()
+        self._schedule_excel_tick()
+    
+    def _schedule_excel_tick(self):
+        """Schedule the next Excel check - sooner while the user is active"""
+        recent = time.monotonic() - self.last_activity < self.ACTIVITY_WINDOW
+        interval = self.EXCEL_POLL_ACTIVE if recent else self.EXCEL_POLL_IDLE
+        self.loop.call_later(interval, self._excel_tick)
+    
+    def stop_event_loop(self):
+        """Stop the persistent asyncio loop"""
+        if self.loop:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.loop_thread.join(timeout=1)
+            self.loop = None
     
     async def connect_to_electron(self, port: int = 9876):
         """Establish WebSocket connection to Electron app"""
+        self.outbox = asyncio.Queue(self.OUTBOX_MAX_BATCHES)
         try:
             uri = f"ws://localhost:{port}"
-            self.websocket = await websockets.connect(uri)
+            # Localhost IPC: skip permessage-deflate, the frame size cap and keep-alive pings
+            # Large write buffer - a burst of batches is flushed without awaiting drain per send
+            self.websocket = await websockets.connect(
+                uri, compression=None, max_size=None, ping_interval=None, write_limit=2**20
+            )
             self.electron_connected = True
             print(f"🔌 Connected to Electron on port {port}")
             
             # Send initial handshake
-            await self.websocket.send(json.dumps({
+            await self.websocket.send(_json_dumps({
                 'type': 'python_service_connected',
-                'platform': platform.system(),
+                'platform': SYSTEM,
                 'capabilities': ['file_system', 'excel', 'desktop']
             }))
             
-            # Start listening for commands from Electron
-            asyncio.create_task(self.listen_for_commands())
+            # Start listening for commands and sending queued events
+            self.tasks = [
+                asyncio.create_task(self.listen_for_commands()),
+                asyncio.create_task(self._send_batches())
+            ]
         except Exception as e:
             print(f"❌ Failed to connect to Electron: {e}")
             self.electron_connected = False
     
     async def send_to_electron(self, event: Dict[str, Any]):
-        """Send captured event to Electron"""
-        if self.websocket and self.electron_connected:
+        """Queue captured event for the next batched send to Electron"""
+        await self.send_batch_to_electron([event])
+    
+    async def send_batch_to_electron(self, events: List[Dict[str, Any]]):
+        """Queue a batch of events to go to Electron in a single frame"""
+        if self.websocket and self.electron_connected and events:
+            if self.outbox.full():
+                # Electron is falling behind - drop the oldest batch rather than grow
+                self.event_queue.record_dropped(len(self.outbox.get_nowait()))
+            self.outbox.put_nowait(events)
+    
+    async def _send_batches(self):
+        """Drain the outbox and send events to Electron, one frame per batch"""
+        while self.electron_connected:
+            events = list(await self.outbox.get())
+            self._drain_outbox(events)
+            
+            # Give a burst a moment to fill the batch before sending
+            if len(events) < self.BATCH_MAX_EVENTS and self.outbox.empty():
+                await asyncio.sleep(self.BATCH_MAX_DELAY)
+                self._drain_outbox(events)
+            
+            # Lone events go out as-is, bursts as a single batch frame
+            frame = events[0] if len(events) == 1 else {'type': 'batch', 'events': events}
             try:
-                await self.websocket.send(json.dumps(event))
+                await self.websocket.send(_json_dumps(frame))
             except:
                 self.electron_connected = False
     
+    def _drain_outbox(self, events: List[Dict[str, Any]]):
+        """Merge already-queued batches into this one without waiting"""
+        while len(events) < self.BATCH_MAX_EVENTS:
+            try:
+                events.extend(self.outbox.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+    
     async def listen_for_commands(self):
         """Listen for commands from Electron"""
         if not self.websocket:
@@ -459,7 +1050,7 @@ class ProcessCaptureService:
         try:
             async for message in self.websocket:
                 try:
-                    command = json.loads(message)
+                    command = _json_loads(message)
                     await self.handle_command(command)
                 except json.JSONDecodeError:
                     print(f"Invalid command received: {message}")
@@ -474,39 +1065,22 @@ class ProcessCaptureService:
         if cmd_type == 'capture_paste_destination':
             app_name = command.get('application', 'Unknown')
             window = command.get('window', '')
-            print(f"📋 Received request to capture paste destination in {app_name}")
+            logger.info("📋 Received request to capture paste destination in %s", app_name)
+            self.last_activity = time.monotonic()
             await self.capture_paste_destination(command.get('timestamp'), app_name, window)
+        
+        elif cmd_type == 'clipboard_self_write':
+            # Sent by the renderer before it writes to the clipboard, so the write isn't captured as a copy
+            self.clipboard_monitor.mark_self_write(command.get('content', ''))
     
     async def capture_paste_destination(self, paste_timestamp, app_name, window_title):
         """Capture paste destination context based on application type"""
-        # Application-specific handlers
-        handlers = {
-            'Excel': self._capture_excel_destination,
-            'Word': self._capture_word_destination,
-            'PowerPoint': self._capture_powerpoint_destination,
-            # All browsers use the same handler
-            'Chrome': self._capture_browser_destination,
-            'Safari': self._capture_browser_destination,
-            'Firefox': self._capture_browser_destination,
-            'Edge': self._capture_browser_destination,
-            'Opera': self._capture_browser_destination,
-            'Brave': self._capture_browser_destination,
-            'Arc': self._capture_browser_destination,
-            'Vivaldi': self._capture_browser_destination,
-            'Tor Browser': self._capture_browser_destination,
-            'DuckDuckGo': self._capture_browser_destination,
-        }
-        
-        # Find appropriate handler
-        handler = None
-        for app_key in handlers:
-            if app_key.lower() in app_name.lower():
-                handler = handlers[app_key]
-                break
-        
-        # Use generic handler if no specific one found
-        if not handler:
-            handler = self._capture_generic_destination
+        # Find appropriate handler, falling back to the generic one
+        app_lower = app_name.lower()
+        handler = next(
+            (handler for app_key, handler in self.paste_handlers if app_key in app_lower),
+            self._capture_generic_destination
+        )
         
         # Call the handler
         destination_context = await handler(app_name, window_title)
@@ -525,10 +1099,13 @@ class ProcessCaptureService:
         # Get current Excel selection as destination
         if self.excel_capture.excel:
             # Force immediate capture of current selection
-            self.excel_capture.capture_selection()
+            if SYSTEM == "Darwin":
+                await self._in_executor(self.excel_capture.capture_selection)
+            else:
+                self.excel_capture.capture_selection()
             
             try:
-                if platform.system() == "Windows" and self.excel_capture.excel:
+                if SYSTEM == "Windows" and self.excel_capture.excel:
                     sheet = self.excel_capture.excel.ActiveSheet
                     workbook = self.excel_capture.excel.ActiveWorkbook
                     selection = self.excel_capture.excel.Selection
@@ -542,7 +1119,7 @@ class ProcessCaptureService:
                         },
                         'path': workbook.FullName
                     })
-                elif platform.system() == "Darwin":
+                elif SYSTEM == "Darwin":
                     # macOS - use AppleScript
                     script = '''
                     tell application "Microsoft Excel"
@@ -554,8 +1131,7 @@ class ProcessCaptureService:
                         return {addr, sheetName, wbName, wbPath}
                     end tell
                     '''
-                    as_script = applescript.AppleScript(script)
-                    result = as_script.run()
+                    result = await self._in_executor(_run_applescript, script)
                     
                     if result and isinstance(result, list) and len(result) >= 4:
                         destination.update({
@@ -568,10 +1144,24 @@ class ProcessCaptureService:
                             'path': result[3]
                         })
             except Exception as e:
-                print(f"Error capturing Excel destination: {e}")
+                logger.error("Error capturing Excel destination: %s", e)
         
         return destination
     
+    def _get_com_app(self, prog_id: str):
+        """Get a running Office application over COM, reusing the cached object"""
+        app = self.com_apps.get(prog_id)
+        if app is None:
+            # GetObject walks the Running Object Table - only do it once
+            app = win32com.client.GetObject(Class=prog_id)
+            try:
+                # Early-bound dispatch IDs instead of late-bound name lookups
+                app = win32com.client.gencache.EnsureDispatch(app)
+            except Exception:
+                pass
+            self.com_apps[prog_id] = app
+        return app
+    
     async def _capture_word_destination(self, app_name, window_title):
         """Capture Word-specific destination context"""
         destination = {
@@ -582,7 +1172,7 @@ class ProcessCaptureService:
         }
             
         try:
-            if platform.system() == "Darwin":
+            if SYSTEM == "Darwin":
                 # macOS - use AppleScript for Word
                 script = '''
                 tell application "Microsoft Word"
@@ -598,8 +1188,7 @@ class ProcessCaptureService:
                     end try
                 end tell
                 '''
-                as_script = applescript.AppleScript(script)
-                result = as_script.run()
+                result = await self._in_executor(_run_applescript, script)
                 
                 if result and result != 'missing value' and isinstance(result, list):
                     destination.update({
@@ -611,13 +1200,12 @@ class ProcessCaptureService:
                         },
                         'path': result[1] if len(result) > 1 else None
                     })
-            elif platform.system() == "Windows":
+            elif SYSTEM == "Windows":
                 # Windows COM automation for Word
                 try:
-                    import win32com.client
-                    word = win32com.client.GetObject(Class="Word.Application")
-                    if word and word.ActiveDocument:
-                        doc = word.ActiveDocument
+                    word = self._get_com_app("Word.Application")
+                    doc = word.ActiveDocument if word else None
+                    if doc:
                         sel = word.Selection
                         destination.update({
                             'document': doc.Name,
@@ -628,10 +1216,13 @@ class ProcessCaptureService:
                             },
                             'path': doc.FullName
                         })
+                except pythoncom.com_error:
+                    # Word may have been closed - reconnect on the next paste
+                    self.com_apps.pop("Word.Application", None)
                 except:
                     pass
         except Exception as e:
-            print(f"Error capturing Word destination: {e}")
+            logger.error("Error capturing Word destination: %s", e)
         
         return destination
     
@@ -645,7 +1236,7 @@ class ProcessCaptureService:
         }
             
         try:
-            if platform.system() == "Darwin":
+            if SYSTEM == "Darwin":
                 # macOS - use AppleScript for PowerPoint
                 script = '''
                 tell application "Microsoft PowerPoint"
@@ -658,8 +1249,7 @@ class ProcessCaptureService:
                     end try
                 end tell
                 '''
-                as_script = applescript.AppleScript(script)
-                result = as_script.run()
+                result = await self._in_executor(_run_applescript, script)
                 
                 if result and result != 'missing value' and isinstance(result, list):
                     destination.update({
@@ -669,13 +1259,12 @@ class ProcessCaptureService:
                             'type': 'slide'
                         }
                     })
-            elif platform.system() == "Windows":
+            elif SYSTEM == "Windows":
                 # Windows COM automation for PowerPoint
                 try:
-                    import win32com.client
-                    ppt = win32com.client.GetObject(Class="PowerPoint.Application")
-                    if ppt and ppt.ActivePresentation:
-                        pres = ppt.ActivePresentation
+                    ppt = self._get_com_app("PowerPoint.Application")
+                    pres = ppt.ActivePresentation if ppt else None
+                    if pres:
                         window = ppt.ActiveWindow
                         destination.update({
                             'document': pres.Name,
@@ -685,10 +1274,13 @@ class ProcessCaptureService:
                             },
                             'path': pres.FullName
                         })
+                except pythoncom.com_error:
+                    # PowerPoint may have been closed - reconnect on the next paste
+                    self.com_apps.pop("PowerPoint.Application", None)
                 except:
                     pass
         except Exception as e:
-            print(f"Error capturing PowerPoint destination: {e}")
+            logger.error("Error capturing PowerPoint destination: %s", e)
         
         return destination
     
@@ -709,26 +1301,10 @@ class ProcessCaptureService:
             destination['domain'] = parts[-2] if len(parts) > 2 else parts[1]
             
             # Detect specific web applications
-            web_apps = {
-                'salesforce': 'Salesforce',
-                'activecampaign': 'ActiveCampaign',
-                'wordpress': 'WordPress',
-                'gmail': 'Gmail',
-                'docs.google': 'Google Docs',
-                'sheets.google': 'Google Sheets',
-                'notion': 'Notion',
-                'airtable': 'Airtable',
-                'hubspot': 'HubSpot',
-                'slack': 'Slack',
-                'trello': 'Trello',
-                'jira': 'Jira'
-            }
-            
-            for key, app in web_apps.items():
-                if key in window_title.lower():
-                    destination['web_app'] = app
-                    destination['type'] = 'web_application'
-                    break
+            web_app = self._detect_web_app(window_title)
+            if web_app:
+                destination['web_app'] = web_app
+                destination['type'] = 'web_application'
         
         # For now, we can't get the exact form field without browser extension
         # But we can infer from the page title
@@ -739,6 +1315,16 @@ class ProcessCaptureService:
         
         return destination
     
+    def _detect_web_app(self, window_title: str) -> Optional[str]:
+        """Find a known web application in a window title - one scan for all names"""
+        if self.web_app_automaton:
+            for _, app in self.web_app_automaton.iter(window_title.lower()):
+                return app
+            return None
+        
+        match = self.WEB_APP_PATTERN.search(window_title)
+        return self.WEB_APPS[match.group(0).lower()] if match else None
+    
     async def _capture_generic_destination(self, app_name, window_title):
         """Generic fallback for unknown applications"""
         return {
@@ -748,7 +1334,7 @@ class ProcessCaptureService:
             'document': self._extract_document_name(window_title, app_name),
             'location': {
                 'type': 'unknown',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': datetime.now()
             }
         }
     
@@ -757,43 +1343,72 @@ class ProcessCaptureService:
         if not window_title:
             return 'Untitled'
         
-        # Common patterns to remove
-        suffixes = [f' - {app_name}', f' — {app_name}', f' – {app_name}', 
-                   ' - Microsoft', ' - Google', ' - Adobe']
-        
-        for suffix in suffixes:
-            if suffix in window_title:
-                return window_title.split(suffix)[0]
+        # Strip the first suffix found, in priority order, as in "Doc - Google Docs - Word"
+        for suffix in _title_suffixes(app_name):
+            index = window_title.find(suffix)
+            if index >= 0:
+                return window_title[:index]
         
         return window_title
     
     async def _create_unified_paste_event(self, paste_timestamp, destination_context):
         """Create a unified paste event with source and destination"""
-        # Get last clipboard entry for source context
-        last_clipboard = self.clipboard_monitor.get_last_clipboard() if self.clipboard_monitor else None
+        source = None
+        if self.clipboard_monitor:
+            # The monitor may be backed off - pick up a copy made just before this paste
+            await asyncio.get_running_loop().run_in_executor(None, self.clipboard_monitor.check_now)
+            source = self._clipboard_source()
         
-        # Create unified paste event
+        # Create data flow description - destination handlers always return a context
+        if source:
+            src_desc = self._format_location(source)
+            dst_desc = self._format_location(destination_context)
+            data_flow = {
+                'from': src_desc,
+                'to': dst_desc,
+                'transformation': self._detect_transformation(source['type'], destination_context['type'])
+            }
+            description = f"Pasted from {src_desc} to {dst_desc}"
+            logger.info("📋 Cross-app paste: %s → %s", src_desc, dst_desc)
+        else:
+            data_flow = {}
+            description = "Paste operation (incomplete context)"
+        
+        # Create unified paste event - built once, in its final shape
         paste_event = {
             'type': 'cross_app_paste',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(),
             'paste_timestamp': paste_timestamp,
-            'source': None,
+            'source': source,
             'destination': destination_context,
-            'data_flow': {}
+            'data_flow': data_flow,
+            'description': description
         }
         
-        # Add source context from clipboard
+        # Send unified paste event
+        await self.send_to_electron(paste_event)
+    
+    def _clipboard_source(self) -> Optional[Dict[str, Any]]:
+        """Source context from the last clipboard entry - reused until the clipboard changes"""
+        seq = self.clipboard_monitor.get_last_clipboard_seq()
+        if seq == self._clipboard_seq:
+            return self._clipboard_source_cache
+        
+        # Get last clipboard entry for source context
+        last_clipboard = self.clipboard_monitor.get_last_clipboard()
+        source = None
         if last_clipboard:
+            src_ctx = last_clipboard.get('source') or {}
             source = {
-                'application': last_clipboard.get('source', {}).get('application', 'Unknown'),
-                'window': last_clipboard.get('source', {}).get('window_title', ''),
+                'application': src_ctx.get('application', 'Unknown'),
+                'window': src_ctx.get('window_title', ''),
                 'content': last_clipboard.get('content_preview', ''),
                 'data_type': last_clipboard.get('data_type', 'text')
             }
             
             # Add Excel-specific source info if available
-            if last_clipboard.get('source', {}).get('excel_selection'):
-                excel_info = last_clipboard['source']['excel_selection']
+            excel_info = src_ctx.get('excel_selection')
+            if excel_info:
                 source['document'] = excel_info.get('workbook')
                 source['location'] = {
                     'sheet': excel_info.get('sheet'),
@@ -804,155 +1419,135 @@ class ProcessCaptureService:
                 source['type'] = 'spreadsheet'
             else:
                 # Generic source
-                source['document'] = last_clipboard.get('source', {}).get('document', 'Unknown')
+                source['document'] = src_ctx.get('document', 'Unknown')
                 source['type'] = self._infer_app_type(source['application'])
-            
-            paste_event['source'] = source
         
-        # Create data flow description
-        if paste_event['source'] and paste_event['destination']:
-            src_desc = self._format_location(paste_event['source'])
-            dst_desc = self._format_location(paste_event['destination'])
-            
-            paste_event['data_flow'] = {
-                'from': src_desc,
-                'to': dst_desc,
-                'transformation': self._detect_transformation(
-                    paste_event['source']['type'],
-                    paste_event['destination']['type']
-                )
-            }
-            
-            paste_event['description'] = f"Pasted from {src_desc} to {dst_desc}"
-            print(f"📋 Cross-app paste: {src_desc} → {dst_desc}")
-        else:
-            paste_event['description'] = "Paste operation (incomplete context)"
-        
-        # Send unified paste event
-        await self.send_to_electron(paste_event)
+        self._clipboard_seq = seq
+        self._clipboard_source_cache = source
+        return source
     
-    def _infer_app_type(self, app_name):
-        """Infer application type from name"""
-        app_lower = app_name.lower() if app_name else ''
-        
-        if 'excel' in app_lower or 'sheets' in app_lower:
-            return 'spreadsheet'
-        elif 'word' in app_lower or 'docs' in app_lower:
-            return 'document'
-        elif 'powerpoint' in app_lower or 'slides' in app_lower:
-            return 'presentation'
-        elif any(browser in app_lower for browser in ['chrome', 'safari', 'firefox', 'edge']):
-            return 'web_application'
-        elif 'code' in app_lower or 'sublime' in app_lower or 'atom' in app_lower:
-            return 'code_editor'
-        else:
-            return 'unknown'
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _infer_app_type(app_name):
+        """Infer application type from name - cached, app names repeat constantly"""
+        match = _APP_TYPE_RE.match(app_name or '')
+        return match.lastgroup if match else 'unknown'
     
     def _format_location(self, context):
         """Format location for display"""
         if not context:
             return 'Unknown'
         
-        app = context.get('application', 'Unknown')
-        doc = context.get('document', '')
-        
-        # Format based on type
-        if context.get('type') == 'spreadsheet' and context.get('location'):
-            loc = context['location']
-            return f"{doc or app}!{loc.get('sheet', '')}!{loc.get('address', '')}"
-        elif context.get('type') == 'document' and context.get('location'):
-            loc = context['location']
-            return f"{doc or app} (Page {loc.get('page', '?')}, Para {loc.get('paragraph', '?')})"
-        elif context.get('type') == 'presentation' and context.get('location'):
-            loc = context['location']
-            return f"{doc or app} (Slide {loc.get('slide', '?')})"
-        elif context.get('type') == 'web_application':
-            web_app = context.get('web_app', context.get('domain', app))
-            return f"{web_app}: {context.get('page_title', 'Unknown page')}"
-        else:
-            return doc or app
+        name = context.get('document') or context.get('application', 'Unknown')
+        formatter = _LOCATION_FORMATTERS.get(context.get('type'))
+        return formatter(context, name) if formatter else name
     
-    def _detect_transformation(self, source_type, dest_type):
+    @staticmethod
+    def _detect_transformation(source_type, dest_type):
         """Detect data transformation between applications"""
-        transformations = {
-            ('spreadsheet', 'document'): 'table_to_text',
-            ('spreadsheet', 'presentation'): 'data_to_slide',
-            ('spreadsheet', 'web_application'): 'data_to_form',
-            ('document', 'spreadsheet'): 'text_to_cells',
-            ('document', 'presentation'): 'text_to_slide',
-            ('document', 'web_application'): 'text_to_form',
-            ('web_application', 'spreadsheet'): 'web_to_data',
-            ('web_application', 'document'): 'web_to_text'
-        }
-        
-        return transformations.get((source_type, dest_type), 'direct_paste')
+        return _TRANSFORMATIONS.get((source_type, dest_type), 'direct_paste')
     
-    def process_events(self):
-        """Process queued events and send to Electron"""
-        while self.running:
-            try:
-                # Get event with timeout to allow checking running flag
-                event = self.event_queue.get(timeout=1)
+    async def process_events(self):
+        """Process queued events and send to Electron (runs on the event loop)"""
+        # Producers wake this task directly - no executor thread blocking on the queue
+        wakeup = self.event_queue.attach_loop(asyncio.get_running_loop())
+        try:
+            while self.running:
+                await wakeup.wait()
+                wakeup.clear()
                 
+                # Take the whole burst at once
+                batch = self.event_queue.take_all()
+                if batch:
+                    await self._process_batch(batch)
+        finally:
+            self.event_queue.detach_loop()
+    
+    async def _process_batch(self, batch: List[Dict[str, Any]]):
+        """Log a drained batch and send it to Electron"""
+        try:
+            for event in batch:
                 # Log locally
-                print(f"📸 Captured: {event['type']} - {event.get('path', event.get('filename', ''))}")
-                
-                # Send to Electron if connected
-                if self.electron_connected:
-                    asyncio.run(self.send_to_electron(event))
-                
-            except queue.Empty:
-                continue
-            except Exception as e:
-                print(f"Error processing event: {e}")
+                logger.info("📸 Captured: %s - %s", event['type'], event.get('path', event.get('filename', '')))
+                if event['type'] in self.ACTIVITY_EVENTS:
+                    self.last_activity = time.monotonic()
+            
+            # Report overflow once, ahead of the surviving events
+            dropped = self.event_queue.take_dropped()
+            if dropped:
+                logger.warning("⚠️ Capture falling behind - dropped %d oldest events", dropped)
+                batch.insert(0, {
+                    'type': 'capture_overflow',
+                    'timestamp': datetime.now(),
+                    'dropped': dropped
+                })
+            
+            # Send the whole burst to Electron as one frame
+            await self.send_batch_to_electron(batch)
+            
+        except Exception as e:
+            logger.error("Error processing event: %s", e)
     
     def run(self):
         """Main service loop"""
         print("🚀 Process Capture Python Service Starting...")
-        print(f"📍 Platform: {platform.system()}")
-        
-        # Default paths to monitor
-        home = str(Path.home())
-        default_paths = [
-            os.path.join(home, 'Downloads'),
-            os.path.join(home, 'Desktop'),
-            os.path.join(home, 'Documents')
-        ]
+        print(f"📍 Platform: {SYSTEM}")
+        log_listener = _start_log_listener()
         
         # Start file monitoring
-        self.start_file_monitoring(default_paths)
+        self.start_file_monitoring(_DEFAULT_WATCH)
+        
+        # Everything below runs on the persistent event loop
+        self.start_event_loop()
         
         # Start clipboard monitoring
-        if self.clipboard_monitor.start():
+        if self.clipboard_monitor.start(self.loop):
             print("📋 Clipboard monitoring active")
         
-        # Try to connect to Excel
-        if self.excel_capture.connect():
+        # Try to connect to Excel - COM from the loop thread where it will be polled, AppleScript from here
+        if SYSTEM == "Windows":
+            excel_connected = self.call_in_loop(self.excel_capture.connect)
+        else:
+            excel_connected = self.excel_capture.connect()
+        if excel_connected:
             print("📊 Connected to Excel")
         
         # Try to connect to Electron
-        asyncio.run(self.connect_to_electron())
+        asyncio.run_coroutine_threadsafe(self.connect_to_electron(), self.loop).result()
         
-        # Start processing events
+        # Start processing events and periodically checking Excel
         self.running = True
-        event_thread = threading.Thread(target=self.process_events)
-        event_thread.start()
+        event_task = asyncio.run_coroutine_threadsafe(self.process_events(), self.loop)
+        self.loop.call_soon_threadsafe(self._excel_tick)
         
         print("✅ Service running. Press Ctrl+C to stop.")
         
-        try:
-            while self.running:
-                time.sleep(1)
-                # Periodically check Excel
-                if self.excel_capture.excel:
-                    self.excel_capture.capture_selection()
-        except KeyboardInterrupt:
-            print("\n🛑 Stopping service...")
-            self.running = False
-            self.stop_file_monitoring()
-            self.clipboard_monitor.stop()
-            event_thread.join()
-            print("👋 Service stopped")
+        # Park until Ctrl+C / SIGTERM - all the work happens on other threads
+        signal.signal(signal.SIGINT, self._handle_stop_signal)
+        signal.signal(signal.SIGTERM, self._handle_stop_signal)
+        # Windows only runs signal handlers between bytecodes, so wake up there now and then
+        timeout = 1 if SYSTEM == "Windows" else None
+        while not self._stop.wait(timeout):
+            pass
+        
+        print("\n🛑 Stopping service...")
+        self.running = False
+        self.stop_file_monitoring()
+        self.clipboard_monitor.stop()
+        if SYSTEM == "Windows":
+            self.excel_capture.stop()
+        event_task.cancel()
+        self.stop_event_loop()
+        log_listener.stop()
+        print("👋 Service stopped")
+    
+    def stop(self):
+        """Ask run() to shut the service down (safe from any thread)"""
+        self._stop.set()
+    
+    def _handle_stop_signal(self, signum, frame):
+        """Signal handler for Ctrl+C / SIGTERM"""
+        self.stop()
 
 
 if __name__ == "__main__":
@@ -4,10 +4,15 @@ Universal Clipboard Monitor
 Captures clipboard content with source context for data flow tracking
 """
 
+import re
 import time
+import bisect
+import asyncio
+import functools
 import threading
 import platform
-from typing import Optional, Dict, Any
+from collections import deque
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 
 # Cross-platform clipboard library
@@ -17,6 +22,14 @@ except ImportError:
     pyperclip = None
     print("Warning: pyperclip not installed. Install with: pip install pyperclip")
 
+# Optional on macOS - None where the module is missing or on other platforms
+applescript = None
+
+# Clipboard change counters - content is only read when they move
+NSPasteboard = None
+NSPasteboardTypeString = None
+win32clipboard = None
+
 # Platform-specific imports for enhanced context
 if platform.system() == "Darwin":  # macOS
     try:
@@ -25,6 +38,10 @@ if platform.system() == "Darwin":  # macOS
     except ImportError:
         applescript = None
         Quartz = None
+    try:
+        from AppKit import NSPasteboard, NSPasteboardTypeString
+    except ImportError:
+        NSPasteboard = None
 elif platform.system() == "Windows":
     try:
         import win32clipboard
@@ -35,72 +52,304 @@ elif platform.system() == "Windows":
         win32clipboard = None
         psutil = None
 
+# Data type detection in one regex pass - alternatives are tried in the order of
+# the old if-cascade, so the first named group that matches is the type.
+# No two neighbouring quantifiers accept the same characters, so a failed match stays linear.
+_DATA_TYPE_RE = re.compile(r'''
+    (?P<email>  (?:[^@]*@)+[^@.]*\.[^@]*\Z)                  # '.' after the last '@'
+  | (?P<phone>  \D*(?:\d\D*){7,15}\Z)                        # 7-15 digits in total
+  | (?P<url>    \s*(?:https?://|www\.))
+  | (?P<date>   (?=.{0,19}\Z)\s*\d+\s*[-/]\s*\d+\s*[-/]\s*\d+\s*\Z)
+''', re.DOTALL | re.IGNORECASE | re.VERBOSE)
+
+# Text that float() accepts - shared with ExcelCapture so cell and clipboard values agree.
+# Checked after ',' and '$' are stripped - never a date, so order doesn't matter.
+NUMBER_TEXT_RE = re.compile(r'''
+    \s* [-+]?
+    (?: (?: \d(?:_?\d)* (?:\.(?:\d(?:_?\d)*)?)?   # 12, 12., 12.5
+          | \.\d(?:_?\d)* )                        # .5
+        (?:e[-+]?\d(?:_?\d)*)?
+      | inf(?:inity)? | nan )
+    \s*
+''', re.IGNORECASE | re.VERBOSE)
+
+# App names that end window titles, e.g. "Book1.xlsx - Excel"
+_APP_SUFFIXES = (' - Excel', ' - Word', ' - PowerPoint', ' - Google Chrome',
+                 ' - Mozilla Firefox', ' - Safari')
+
+# Compiled AppleScripts, keyed by source - compiling is the expensive part. Shared with
+# capture_service. Compiling only on first use also matters: compiling a script that
+# names an app which isn't installed makes macOS ask the user to locate it.
+# Scripts run on executor threads, so each one is compiled and run under its own lock.
+_compiled_scripts = {}
+_compiled_scripts_lock = threading.Lock()
+
+
+def run_applescript(source: str, *args):
+    """Run an AppleScript, compiling it on first use only (safe from any thread)"""
+    entry = _compiled_scripts.get(source)
+    if entry is None:
+        with _compiled_scripts_lock:
+            entry = _compiled_scripts.setdefault(source, [None, threading.Lock()])
+    with entry[1]:
+        if entry[0] is None:
+            entry[0] = applescript.AppleScript(source)
+        return entry[0].run(*args)
+
+
+# Front app and window title - used until Excel has been seen frontmost
+FRONT_APP_SRC = '''
+tell application "System Events"
+    set frontApp to name of first application process whose frontmost is true
+    set windowTitle to "Unknown"
+    try
+        tell process frontApp
+            set windowTitle to name of front window
+        end tell
+    end try
+    return {frontApp, windowTitle}
+end tell
+'''
+
+# Front app plus, when asked and Excel is frontmost, its selection - one round-trip per copy.
+# Returns {frontApp, windowTitle, address, sheet, workbook, path}, Excel fields "" if unknown.
+# It names Excel, so it is only compiled once Excel has been seen frontmost.
+CONTEXT_SRC = '''
+on run {wantSelection}
+tell application "System Events"
+    set frontApp to name of first application process whose frontmost is true
+    set windowTitle to "Unknown"
+    try
+        tell process frontApp
+            set windowTitle to name of front window
+        end tell
+    end try
+end tell
+set excelSel to {"", "", "", ""}
+if wantSelection and frontApp contains "Excel" then
+    try
+        tell application "Microsoft Excel"
+            set excelSel to {get address of selection, name of active sheet, name of active workbook, full name of active workbook}
+        end tell
+    end try
+end if
+return {frontApp, windowTitle} & excelSel
+end run
+'''
+
 
 class ClipboardMonitor:
     """Monitors clipboard changes and captures content with context"""
     
+    # Polling interval - backs off while the clipboard is idle, where only content comparison works
+    MIN_INTERVAL = 0.2  # seconds
+    MAX_INTERVAL = 2.0  # seconds
+    BACKOFF = 1.5
+    
+    # Larger copies are captured by size alone, without reading the text
+    MAX_READ_BYTES = 1024 * 1024
+    
+    # A host write must show up within this long of being marked, or the mark is dropped
+    SELF_WRITE_TTL = 5.0  # seconds
+    
     def __init__(self, event_queue):
         self.event_queue = event_queue
-        self.last_clipboard = ""
+        self._last_fingerprint = (0, hash(""))  # (size, hash) of the last clipboard content
         self.monitoring = False
         self.monitor_thread = None
-        self.clipboard_history = []
+        self.monitor_task = None  # future of the asyncio monitor, when run on a loop
         self.max_history = 50
+        self.clipboard_history = deque(maxlen=self.max_history)  # oldest drop off automatically
+        self._history_times = deque(maxlen=self.max_history)  # timestamps of clipboard_history, in step
+        self._history_lock = threading.Lock()  # both lists change together, and are read together
+        self._self_writes = {}  # hash of content the host app is writing -> monotonic expiry
+        self.sequence = 0  # bumped after each captured change is in the history
+        self._last_change_count = None  # OS clipboard change counter at the last read
+        self._poll_lock = threading.Lock()  # the monitor and check_now() never read at once
+        self._interval = self.MIN_INTERVAL
+        
+        # psutil.Process per foreground PID on Windows - the same app owns most copies
+        self._proc_cache: Dict[int, Any] = {}
+        
+        # Excel has been frontmost at a copy, so CONTEXT_SRC can be compiled and used
+        self._excel_seen = False
         
-    def start(self):
-        """Start monitoring clipboard changes"""
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Start monitoring clipboard changes - as a task on loop if given, else in a thread"""
         if not pyperclip:
             print("❌ Clipboard monitoring disabled - pyperclip not installed")
             return False
             
         self.monitoring = True
-        self.monitor_thread = threading.Thread(target=self._monitor_loop)
-        self.monitor_thread.daemon = True
-        self.monitor_thread.start()
+        if loop:
+            self.monitor_task = asyncio.run_coroutine_threadsafe(self._monitor_loop_async(), loop)
+        else:
+            self.monitor_thread = threading.Thread(target=self._monitor_loop)
+            self.monitor_thread.daemon = True
+            self.monitor_thread.start()
         print("📋 Clipboard monitoring started")
         return True
     
     def stop(self):
         """Stop monitoring clipboard"""
         self.monitoring = False
+        if self.monitor_task:
+            self.monitor_task.cancel()
+            self.monitor_task = None
         if self.monitor_thread:
             self.monitor_thread.join(timeout=1)
         print("📋 Clipboard monitoring stopped")
     
+    def mark_self_write(self, content: str):
+        """Don't capture content as a copy - the host app is putting it on the clipboard itself"""
+        fingerprint = (len(content), hash(content))
+        if fingerprint == self._last_fingerprint:
+            return  # already on the clipboard - the write won't show up as a change
+        self._self_writes[fingerprint[1]] = time.monotonic() + self.SELF_WRITE_TTL
+    
+    def check_now(self) -> bool:
+        """Check the clipboard immediately, e.g. before linking a paste to its source"""
+        if not pyperclip:
+            return False
+        try:
+            return self._poll()
+        except Exception as e:
+            print(f"Clipboard monitor error: {e}")
+            return False
+    
     def _monitor_loop(self):
-        """Main monitoring loop"""
+        """Main monitoring loop (thread)"""
         while self.monitoring:
+            changed = False
             try:
-                current_clipboard = pyperclip.paste()
+                if self._clipboard_may_have_changed():
+                    changed = self._poll()
+            except Exception as e:
+                print(f"Clipboard monitor error: {e}")
                 
-                # Check if clipboard changed
-                if current_clipboard and current_clipboard != self.last_clipboard:
-                    self._handle_clipboard_change(current_clipboard)
-                    self.last_clipboard = current_clipboard
-                    
+            time.sleep(self._next_interval(changed))
+    
+    async def _monitor_loop_async(self):
+        """Main monitoring loop (asyncio) - blocking reads run in the loop's executor"""
+        loop = asyncio.get_running_loop()
+        while self.monitoring:
+            changed = False
+            try:
+                # The change counter is cheap - only reading and context lookups leave the loop
+                if self._clipboard_may_have_changed():
+                    changed = await loop.run_in_executor(None, self._poll)
             except Exception as e:
                 print(f"Clipboard monitor error: {e}")
                 
-            time.sleep(0.5)  # Check twice per second
+            await asyncio.sleep(self._next_interval(changed))
     
-    def _handle_clipboard_change(self, content):
-        """Process clipboard change"""
-        # Get source application context
-        source_context = self._get_source_context()
+    def _next_interval(self, changed: bool) -> float:
+        """Back off while the clipboard is idle, snap back to fast polling on a change"""
+        # With a change counter an idle poll costs next to nothing - stay fast, so a copy is
+        # seen (with its source app) before the user can switch apps and paste
+        if changed or NSPasteboard or win32clipboard:
+            self._interval = self.MIN_INTERVAL
+        else:
+            self._interval = min(self._interval * self.BACKOFF, self.MAX_INTERVAL)
+        return self._interval
+    
+    def _clipboard_may_have_changed(self) -> bool:
+        """Cheap pre-check against the OS change counter"""
+        change_count = self._clipboard_change_count()
+        return change_count is None or change_count != self._last_change_count
+    
+    def _poll(self) -> bool:
+        """Read the clipboard if it changed - True when new content was captured"""
+        with self._poll_lock:
+            change_count = self._clipboard_change_count()
+            if change_count is not None and change_count == self._last_change_count:
+                return False
+            
+            current_clipboard, size = self._read_clipboard_bounded()
+            self._last_change_count = change_count  # only once read - a failed read is retried
+            
+            # Check if clipboard changed - by fingerprint, so the last content isn't kept around
+            if current_clipboard is None:
+                fingerprint = (size, change_count)  # too large to read, the counter tells copies apart
+            else:
+                fingerprint = (size, hash(current_clipboard))
+            if size and fingerprint != self._last_fingerprint:
+                # Marks only cover the next change - a write that never happened can't swallow a later copy
+                self_writes, self._self_writes = self._self_writes, {}
+                expiry = self_writes.get(fingerprint[1]) if current_clipboard is not None else None
+                if expiry and expiry >= time.monotonic():
+                    # Written by the host app, not copied by the user
+                    self._last_fingerprint = fingerprint
+                    return False
+                if current_clipboard is None:
+                    content_fields, from_cells = self._oversize_fields(size), True
+                else:
+                    content_fields, from_cells = self._summarize_content(current_clipboard)
+                del current_clipboard  # a multi-MB copy is freed before the slower context lookup
+                self._handle_clipboard_change(content_fields, from_cells)
+                self._last_fingerprint = fingerprint
+                return True
+            return False
+    
+    def _read_clipboard_bounded(self) -> Tuple[Optional[str], int]:
+        """Clipboard text and its size - text is None when over MAX_READ_BYTES"""
+        if NSPasteboard and NSPasteboardTypeString:
+            # In-process read, no pbpaste fork - the byte size is checked before any text is built
+            pasteboard = NSPasteboard.generalPasteboard()
+            data = pasteboard.dataForType_(NSPasteboardTypeString)
+            if data is None:
+                return "", 0
+            if data.length() > self.MAX_READ_BYTES:
+                return None, data.length()
+            text = str(pasteboard.stringForType_(NSPasteboardTypeString) or "")
+            return text, len(text)
         
-        # Detect data type
-        data_type = self._detect_data_type(content)
+        text = pyperclip.paste()
+        return text, len(text)
+    
+    def _clipboard_change_count(self) -> Optional[int]:
+        """OS clipboard change counter - None where only content comparison works"""
+        if NSPasteboard:
+            return NSPasteboard.generalPasteboard().changeCount()
+        if win32clipboard:
+            return win32clipboard.GetClipboardSequenceNumber()
+        return None
+    
+    def _summarize_content(self, content: str):
+        """Event fields for the copied content, and whether it looks like copied cells"""
+        lines = content.count('\n') + 1
+        fields = {
+            'content': content[:1000],  # Limit size for large copies
+            'content_preview': self._get_preview(content),
+            'data_type': self._detect_data_type(content),
+            'length': len(content),
+            'lines': lines
+        }
+        # Excel ends every copied row with a newline, even a single cell's - text from the
+        # formula bar or a cell being edited has none, so no selection is looked up for it
+        return fields, lines > 1 or '\t' in content
+    
+    def _oversize_fields(self, size: int) -> Dict[str, Any]:
+        """Event fields for a copy too large to read - size in bytes"""
+        return {
+            'content': '',
+            'content_preview': f"[Large clipboard, {size:,} bytes]",
+            'data_type': 'large',
+            'length': size,
+            'lines': None
+        }
+    
+    def _handle_clipboard_change(self, content_fields: Dict[str, Any], from_cells: bool = False):
+        """Process clipboard change - content_fields from _summarize_content"""
+        # Get source application context
+        source_context = self._get_source_context(from_cells)
         
         # Create clipboard event
         event = {
             'type': 'clipboard_copy',
-            'timestamp': datetime.now().isoformat(),
-            'content': content[:1000],  # Limit size for large copies
-            'content_preview': self._get_preview(content),
-            'data_type': data_type,
-            'source': source_context,
-            'length': len(content),
-            'lines': content.count('\n') + 1 if '\n' in content else 1
+            'timestamp': datetime.now(),  # formatted to ISO when sent to Electron
+            **content_fields,
+            'source': source_context
         }
         
         # Add Excel selection details if available
@@ -109,16 +358,17 @@ class ClipboardMonitor:
             print(f"📊 Excel cells: {source_context['excel_selection']['address']} from {source_context['excel_selection']['workbook']}")
         
         # Add to history
-        self.clipboard_history.append(event)
-        if len(self.clipboard_history) > self.max_history:
-            self.clipboard_history.pop(0)
+        with self._history_lock:
+            self.clipboard_history.append(event)
+            self._history_times.append(event['timestamp'])
+        self.sequence += 1
         
         # Send to event queue
         self.event_queue.put(event)
         
         print(f"📋 Clipboard captured: {event['content_preview']} from {source_context.get('application', 'Unknown')}")
     
-    def _get_source_context(self) -> Dict[str, Any]:
+    def _get_source_context(self, want_excel_selection: bool = True) -> Dict[str, Any]:
         """Get context about the source application"""
         context = {
             'application': 'Unknown',
@@ -127,7 +377,7 @@ class ClipboardMonitor:
         }
         
         if platform.system() == "Darwin":  # macOS
-            context = self._get_macos_context()
+            context = self._get_macos_context(want_excel_selection)
         elif platform.system() == "Windows":
             context = self._get_windows_context()
         elif platform.system() == "Linux":
@@ -135,8 +385,8 @@ class ClipboardMonitor:
             
         return context
     
-    def _get_macos_context(self) -> Dict[str, Any]:
-        """Get macOS application context"""
+    def _get_macos_context(self, want_excel_selection: bool = True) -> Dict[str, Any]:
+        """Get macOS application context - Excel selection only when want_excel_selection"""
         context = {
             'application': 'Unknown',
             'window_title': 'Unknown',
@@ -146,31 +396,21 @@ class ClipboardMonitor:
         
         if applescript:
             try:
-                # Get frontmost application
-                script = '''
-                tell application "System Events"
-                    set frontApp to name of first application process whose frontmost is true
-                    set windowTitle to "Unknown"
-                    try
-                        tell process frontApp
-                            set windowTitle to name of front window
-                        end tell
-                    end try
-                    return {frontApp, windowTitle}
-                end tell
-                '''
-                as_script = applescript.AppleScript(script)
-                result = as_script.run()
+                # Get frontmost application, and the Excel selection in the same call
+                if self._excel_seen:
+                    result = run_applescript(CONTEXT_SRC, want_excel_selection)
+                else:
+                    result = run_applescript(FRONT_APP_SRC)
+                    if result and 'Excel' in result[0]:
+                        # First copy from Excel - it's installed, so the Excel-aware script is safe
+                        self._excel_seen = True
+                        if want_excel_selection:
+                            result = run_applescript(CONTEXT_SRC, True)
                 if result:
-                    # AppleScript returns a list
-                    if isinstance(result, list) and len(result) >= 2:
-                        context['application'] = result[0]
-                        context['window_title'] = result[1]
-                    elif isinstance(result, str):
-                        parts = result.split(', ')
-                        if len(parts) >= 2:
-                            context['application'] = parts[0]
-                            context['window_title'] = parts[1]
+                    # Both scripts return an AppleScript list, which py-applescript always
+                    # decodes to a Python list - titles with commas stay intact
+                    context['application'] = result[0]
+                    context['window_title'] = result[1]
                     
                     # Extract document name from window title
                     context['document'] = self._extract_document_name(
@@ -178,47 +418,20 @@ class ClipboardMonitor:
                         context['application']
                     )
                     
-                    # If Excel, get selection details
-                    if 'Excel' in context['application']:
-                        context['excel_selection'] = self._get_excel_selection()
+                    # If Excel, selection details came back with it
+                    if len(result) >= 6 and result[2]:
+                        context['excel_selection'] = {
+                            'address': result[2],
+                            'sheet': result[3],
+                            'workbook': result[4],
+                            'path': result[5] or None
+                        }
                         
             except Exception as e:
                 print(f"Error getting macOS context: {e}")
                 
         return context
     
-    def _get_excel_selection(self) -> Optional[Dict[str, Any]]:
-        """Get current Excel selection details"""
-        try:
-            script = '''
-            tell application "Microsoft Excel"
-                try
-                    set sel to selection
-                    set addr to get address of sel
-                    set sheetName to name of active sheet
-                    set wbName to name of active workbook
-                    set wbPath to full name of active workbook
-                    return {addr, sheetName, wbName, wbPath}
-                on error
-                    return missing value
-                end try
-            end tell
-            '''
-            as_script = applescript.AppleScript(script)
-            result = as_script.run()
-            
-            if result and result != 'missing value':
-                if isinstance(result, list) and len(result) >= 3:
-                    return {
-                        'address': result[0],
-                        'sheet': result[1],
-                        'workbook': result[2],
-                        'path': result[3] if len(result) > 3 else None
-                    }
-        except Exception as e:
-            print(f"Could not get Excel selection: {e}")
-        return None
-    
     def _get_windows_context(self) -> Dict[str, Any]:
         """Get Windows application context"""
         context = {
@@ -235,8 +448,7 @@ class ClipboardMonitor:
                 
                 # Get process info
                 _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                process = psutil.Process(pid)
-                app_name = process.name()
+                app_name = self._process_name(pid)
                 
                 context['application'] = app_name
                 context['window_title'] = window_title
@@ -247,6 +459,19 @@ class ClipboardMonitor:
                 
         return context
     
+    def _process_name(self, pid: int) -> str:
+        """Process name for pid, reusing the psutil.Process from earlier copies"""
+        process = self._proc_cache.get(pid)
+        if process is None:
+            if len(self._proc_cache) >= 64:
+                self._proc_cache.clear()
+            process = self._proc_cache[pid] = psutil.Process(pid)
+        try:
+            return process.name()
+        except psutil.NoSuchProcess:
+            self._proc_cache.pop(pid, None)
+            raise
+    
     def _get_linux_context(self) -> Dict[str, Any]:
         """Get Linux application context - basic implementation"""
         # This would need xdotool or similar
@@ -256,8 +481,10 @@ class ClipboardMonitor:
             'document': None
         }
     
-    def _extract_document_name(self, window_title: str, app_name: str) -> Optional[str]:
-        """Extract document name from window title"""
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _extract_document_name(window_title: str, app_name: str) -> Optional[str]:
+        """Extract document name from window title - cached, titles repeat across copies"""
         if not window_title:
             return None
             
@@ -266,11 +493,16 @@ class ClipboardMonitor:
         # Word: "Document1.docx - Word"
         # Chrome: "Page Title - Google Chrome"
         
-        # Remove app name from end
-        for suffix in [' - Excel', ' - Word', ' - PowerPoint', ' - Google Chrome', 
-                      ' - Mozilla Firefox', ' - Safari', ' — ', ' – ']:
-            if suffix in window_title:
-                return window_title.split(suffix)[0]
+        # Remove app name from end - one C-level check before looking for which one
+        if window_title.endswith(_APP_SUFFIXES):
+            for suffix in _APP_SUFFIXES:
+                if window_title.endswith(suffix):
+                    return window_title[:-len(suffix)]
+                    
+        # Dash separators, e.g. "filename.ext — folder"
+        for separator in (' — ', ' – '):
+            if separator in window_title:
+                return window_title.partition(separator)[0]
                 
         # For code editors
         if any(editor in app_name.lower() for editor in ['code', 'sublime', 'atom']):
@@ -282,35 +514,15 @@ class ClipboardMonitor:
     
     def _detect_data_type(self, content: str) -> str:
         """Detect the type of data in clipboard"""
-        content_lower = content.lower().strip()
-        
-        # Email detection
-        if '@' in content and '.' in content.split('@')[-1]:
-            return 'email'
-            
-        # Phone number detection
-        if any(char.isdigit() for char in content):
-            digits = ''.join(char for char in content if char.isdigit())
-            if 7 <= len(digits) <= 15:
-                return 'phone'
-                
-        # URL detection
-        if content_lower.startswith(('http://', 'https://', 'www.')):
-            return 'url'
+        # Email, phone, URL or date
+        match = _DATA_TYPE_RE.match(content)
+        if match:
+            return match.lastgroup
             
         # Number detection
-        try:
-            float(content.replace(',', '').replace('$', '').strip())
+        if NUMBER_TEXT_RE.fullmatch(content.replace(',', '').replace('$', '')):
             return 'number'
-        except:
-            pass
             
-        # Date detection (basic)
-        if any(sep in content for sep in ['/', '-']) and len(content) < 20:
-            parts = content.replace('/', '-').split('-')
-            if len(parts) == 3 and all(p.strip().isdigit() for p in parts):
-                return 'date'
-                
         # Multi-line detection
         if '\n' in content or '\t' in content:
             if '\t' in content:
@@ -325,14 +537,14 @@ class ClipboardMonitor:
         if len(content) <= max_length:
             return content
             
-        # For multiline content, show first line
-        if '\n' in content:
-            first_line = content.split('\n')[0]
-            if len(first_line) <= max_length:
-                return first_line + '...'
-            return first_line[:max_length] + '...'
-            
-        return content[:max_length] + '...'
+        # For multiline content, show first line - only the first max_length chars are searched
+        newline = content.find('\n', 0, max_length)
+        first_end = newline if newline >= 0 else max_length
+        return content[:first_end] + '...'
+    
+    def get_last_clipboard_seq(self) -> int:
+        """Sequence number of the last captured clipboard change (0 = none yet)"""
+        return self.sequence
     
     def get_last_clipboard(self) -> Optional[Dict[str, Any]]:
         """Get the last clipboard entry"""
@@ -344,10 +556,10 @@ class ClipboardMonitor:
         """Find where clipboard content was pasted based on timing"""
         # This would be called when a paste event is detected
         # to link clipboard content with destination
-        if self.clipboard_history:
-            # Find the most recent clipboard entry before paste
-            for entry in reversed(self.clipboard_history):
-                entry_time = datetime.fromisoformat(entry['timestamp'])
-                if entry_time <= paste_time:
-                    return entry
+        # Find the most recent clipboard entry before paste - entries are in time order.
+        # A maxlen-50 deque fits in one block, so the bisect's indexing stays O(1)
+        with self._history_lock:
+            index = bisect.bisect_right(self._history_times, paste_time) - 1
+            if index >= 0:
+                return self.clipboard_history[index]
         return None
\ No newline at end of file
@@ -488,7 +488,9 @@ class ProcessCaptureApp {
                 console.log('Copy button clicked');
                 const preview = document.getElementById('export-preview');
                 if (preview && preview.value) {
-                    navigator.clipboard.writeText(preview.value).then(() => {
+                    // Mark the write first so the clipboard monitor doesn't record it as a copy
+                    Promise.resolve(window.electronAPI?.markClipboardWrite?.(preview.value))
+                        .then(() => navigator.clipboard.writeText(preview.value)).then(() => {
                         this.showNotification('Copied to clipboard!');
                     }).catch(err => {
                         console.error('Failed to copy:', err);
@@ -2115,7 +2117,9 @@ class ProcessCaptureApp {
                 console.log('Copy button clicked (re-attached)');
                 const preview = document.getElementById('export-preview');
                 if (preview && preview.value) {
-                    navigator.clipboard.writeText(preview.value).then(() => {
+                    // Mark the write first so the clipboard monitor doesn't record it as a copy
+                    Promise.resolve(window.electronAPI?.markClipboardWrite?.(preview.value))
+                        .then(() => navigator.clipboard.writeText(preview.value)).then(() => {
                         this.showNotification('Copied to clipboard!', 'success');
                     }).catch(err => {
                         console.error('Failed to copy:', err);
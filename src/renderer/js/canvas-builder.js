@@ -1546,7 +1546,9 @@ class CanvasBuilder {
         
         // Copy button handler
         document.getElementById('copy-code').addEventListener('click', () => {
-            navigator.clipboard.writeText(code).then(() => {
+            // Mark the write first so the clipboard monitor doesn't record it as a copy
+            Promise.resolve(window.electronAPI?.markClipboardWrite?.(code))
+                .then(() => navigator.clipboard.writeText(code)).then(() => {
                 const btn = document.getElementById('copy-code');
                 btn.textContent = '✅ Copied!';
                 setTimeout(() => {
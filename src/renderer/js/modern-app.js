@@ -849,7 +849,10 @@ class ModernProcessCaptureApp {
         
         copyBtn?.addEventListener('click', () => {
             if (previewText.value) {
-                navigator.clipboard.writeText(previewText.value);
+                // Mark the write first so the clipboard monitor doesn't record it as a copy
+                const text = previewText.value;
+                Promise.resolve(window.electronAPI?.markClipboardWrite?.(text))
+                    .then(() => navigator.clipboard.writeText(text));
                 this.showToast('Copied to clipboard', 'success');
             }
         });
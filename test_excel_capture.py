@@ -29,31 +29,32 @@ def test_excel_capture():
     print("✅ Monitoring started. Copy from Excel now...")
     
     # Monitor for 30 seconds
-    start_time = time.time()
-    while time.time() - start_time < 30:
+    end_time = time.time() + 30
+    while time.time() < end_time:
         try:
-            # Check for events
-            if not event_queue.empty():
-                event = event_queue.get()
-                print("\n📋 Clipboard Event Captured:")
-                print(f"   Content: {event.get('content_preview')}")
-                print(f"   From: {event['source'].get('application')}")
-                print(f"   Document: {event['source'].get('document')}")
-                
-                # If Excel cells captured
-                if event.get('excel_cells'):
-                    cells = event['excel_cells']
-                    print(f"   📊 Excel Details:")
-                    print(f"      Cells: {cells.get('address')}")
-                    print(f"      Sheet: {cells.get('sheet')}")
-                    print(f"      Workbook: {cells.get('workbook')}")
-                    print(f"      Path: {cells.get('path')}")
-                    print("\n   ✅ SUCCESS! Full Excel context captured for repeatability!")
-                else:
-                    print("   ⚠️  No Excel cell details captured")
-                print()
-                
-            time.sleep(0.5)
+            # Wait for the next event - wakes up as soon as one arrives
+            try:
+                event = event_queue.get(timeout=max(0.0, min(1.0, end_time - time.time())))
+            except queue.Empty:
+                continue
+            
+            print("\n📋 Clipboard Event Captured:")
+            print(f"   Content: {event.get('content_preview')}")
+            print(f"   From: {event['source'].get('application')}")
+            print(f"   Document: {event['source'].get('document')}")
+            
+            # If Excel cells captured
+            if event.get('excel_cells'):
+                cells = event['excel_cells']
+                print(f"   📊 Excel Details:")
+                print(f"      Cells: {cells.get('address')}")
+                print(f"      Sheet: {cells.get('sheet')}")
+                print(f"      Workbook: {cells.get('workbook')}")
+                print(f"      Path: {cells.get('path')}")
+                print("\n   ✅ SUCCESS! Full Excel context captured for repeatability!")
+            else:
+                print("   ⚠️  No Excel cell details captured")
+            print()
         except KeyboardInterrupt:
             break
     